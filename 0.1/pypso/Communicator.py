@@ -25,18 +25,20 @@ limitations under the License.
 '''
 
 #Particle communicator interface
+#The communicators work over the whole swarm at once, using the topology
+#state buffers (Topology.positions, Topology.velocities, ...).
 class Communicator(object):
     
-    #Update the particle position inside the search space
-    #@param particle: the particle to be updated
-    #@param topology: The topology of the particle
+    #Update the particles position inside the search space
+    #v = w * v + c1 * r1 * (pbest - x) + c2 * r2 * (gbest - x)
+    #@param topology: The topology of the particles
+    #@param w : velocity coefficient (inertia/constriction factor)
     #@param c1 : cognitive coefficient acceleration
     #@param c2 : social   coefficient acceleration
-    def updateParticlePosition(self,particle,topology,c1,c2):
+    def updateSwarmPosition(self,topology,w,c1,c2):
         pass
     
-    #Update the particle information (fitness)
-    #@param particle: The particle to be updated
-    #@param topology: The topology of the particle
-    def updateParticleInformation(self,particle,topology):
+    #Update the particles information (own best and topology best)
+    #@param topology: The topology of the particles
+    def updateSwarmInformation(self,topology):
         pass
@@ -0,0 +1,219 @@
+'''
+Particle Swarm Optimization - PyPSO
+
+Copyright (c) 2009 Marcel Pinheiro Caraciolo
+caraciol@gmail.com
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+
+'''
+    This module contains the class CUDA Global Topology, which extends
+    the global topology class keeping the swarm state in the GPU memory.
+    It requires Numba with CUDA support.
+
+    The fitness function must be a Numba CUDA device function, which
+    receives the particle position (one row) and returns the fitness:
+
+      >> @cuda.jit(device=True)
+      >> def sphere(position):
+      >>     total = 0.0
+      >>     for i in range(position.shape[0]):
+      >>         total += position[i] * position[i]
+      >>     return total
+      >> pso.setFunction(sphere)
+'''
+
+from pypso import GlobalTopology
+from pypso import Consts
+from pypso import Pso
+from numba import cuda
+from numba.cuda.random import create_xoroshiro128p_states
+from numba.cuda.random import xoroshiro128p_uniform_float64
+
+#Moves the swarm one step, one thread per (particle,dimension) pair
+#v = w * v + c1 * r1 * (pbest - x) + c2 * r2 * (gbest - x)
+#The velocity is limited to [-vmax,vmax] and reflected at the position bounds.
+@cuda.jit
+def _pso_step(pos,vel,pbest,best,w,c1,c2,vmax,plo,phi,states):
+    idx = cuda.grid(1)
+    n, dimensions = pos.shape
+    if idx >= n * dimensions:
+        return
+    i = idx // dimensions
+    d = idx % dimensions
+    r1 = xoroshiro128p_uniform_float64(states,idx)
+    r2 = xoroshiro128p_uniform_float64(states,idx)
+    v = w * vel[i,d] + c1 * r1 * (pbest[i,d] - pos[i,d]) + c2 * r2 * (pbest[best,d] - pos[i,d])
+    v = min(max(v,-vmax[d]),vmax[d])
+    x = pos[i,d] + v
+    if x > phi[d]:
+        x = phi[d]
+        v = -v
+    elif x < plo[d]:
+        x = plo[d]
+        v = -v
+    vel[i,d] = v
+    pos[i,d] = x
+
+#Updates the best position and fitness of each particle, one thread per particle
+@cuda.jit
+def _update_pbest(pos,fitness,pbest,pbestFitness,maximize):
+    i = cuda.grid(1)
+    if i >= pos.shape[0]:
+        return
+    if maximize:
+        improved = fitness[i] > pbestFitness[i]
+    else:
+        improved = fitness[i] < pbestFitness[i]
+    if improved:
+        pbestFitness[i] = fitness[i]
+        for d in range(pos.shape[1]):
+            pbest[i,d] = pos[i,d]
+
+#Creates the kernel which evaluates the fitness, one thread per particle
+#@param function: the Numba CUDA device function
+#@return the kernel
+def evaluateKernel(function):
+    @cuda.jit
+    def evaluate(pos,fitness):
+        i = cuda.grid(1)
+        if i < pos.shape[0]:
+            fitness[i] = function(pos[i])
+    return evaluate
+
+
+##Class CUDA Global Topology - The Star Topology running on the GPU
+class CudaGlobalTopology(GlobalTopology.GlobalTopology):
+
+    #Class Constructor
+    #@param swarmSize : The number of particles used by the topology.
+    #@param dimensions: The numbero of dimensions used by the particles.
+    #@param threadsPerBlock: The number of CUDA threads per block.
+    def __init__(self,swarmSize,dimensions,threadsPerBlock=256):
+        #Call the superclass constructor
+        super(CudaGlobalTopology,self).__init__(swarmSize,dimensions)
+        self.threadsPerBlock = threadsPerBlock
+        #Kernel which evaluates the fitness function
+        self.evaluate = None
+        #Device copies of the state buffers
+        self.devPositions = None
+        self.devVelocities = None
+        self.devPbest = None
+        self.devFitness = None
+        self.devPbestFitness = None
+        #Device copies of the bounds
+        self.devVelocityBounds = None
+        self.devPositionLow = None
+        self.devPositionHigh = None
+        #Random generator states, one per (particle,dimension) pair
+        self.devStates = None
+        #True if the host buffers are older than the device copies
+        self.hostStale = False
+
+    #Initialize the swarm on the device
+    def initialize(self):
+        self.evaluate = evaluateKernel(Pso.PSO().function)
+        super(CudaGlobalTopology,self).initialize()
+    
+    #Initializes the particles of the swarm and copies them to the device
+    def initializeSwarm(self):
+        super(CudaGlobalTopology,self).initializeSwarm()
+        self.toDevice()
+
+    #Evaluates the fitness of all particles (copying the positions to the device)
+    def evaluateFitness(self):
+        devPositions = cuda.to_device(self.positions)
+        devFitness = cuda.device_array(self.swarmSize)
+        self.evaluate[self.blocks(self.swarmSize),self.threadsPerBlock](devPositions,devFitness)
+        devFitness.copy_to_host(self.fitness)
+
+    #Copies the swarm state and the bounds to the device
+    def toDevice(self):
+        self.devPositions = cuda.to_device(self.positions)
+        self.devVelocities = cuda.to_device(self.velocities)
+        self.devPbest = cuda.to_device(self.pbest)
+        self.devFitness = cuda.to_device(self.fitness)
+        self.devPbestFitness = cuda.to_device(self.pbestFitness)
+        self.devVelocityBounds = cuda.to_device(self.velocityBounds)
+        self.devPositionLow = cuda.to_device(self.positionBounds[:,0].copy())
+        self.devPositionHigh = cuda.to_device(self.positionBounds[:,1].copy())
+        seed = Pso.PSO().rng.randint(0,2**31 - 1)
+        self.devStates = create_xoroshiro128p_states(self.positions.size,seed=seed)
+
+    #Copies the swarm state back to the host buffers
+    def toHost(self):
+        self.devPositions.copy_to_host(self.positions)
+        self.devVelocities.copy_to_host(self.velocities)
+        self.devPbest.copy_to_host(self.pbest)
+        self.devFitness.copy_to_host(self.fitness)
+        self.devPbestFitness.copy_to_host(self.pbestFitness)
+        self.hostStale = False
+    
+    #Copies the swarm state back to the host buffers if the device copies changed
+    def synchronize(self):
+        if self.hostStale:
+            self.toHost()
+
+    #@return the number of blocks needed to run n threads
+    def blocks(self,n):
+        return (n + self.threadsPerBlock - 1) // self.threadsPerBlock
+
+    #Updates the particles position and evaluates their fitness on the device
+    #@param w, c1, c2 : the velocity coefficients (see Topology.updateParticlesPosition)
+    def updateParticlesPosition(self,w,c1,c2):
+        threads = self.threadsPerBlock
+        _pso_step[self.blocks(self.positions.size),threads](self.devPositions,self.devVelocities,self.devPbest,
+                  self.bestIndex,w,c1,c2,self.devVelocityBounds,self.devPositionLow,self.devPositionHigh,self.devStates)
+        self.evaluate[self.blocks(self.swarmSize),threads](self.devPositions,self.devFitness)
+        self.hostStale = True
+    
+    #Updates the particles information on the device, only the best fitness
+    #of each particle is copied back to choose the best particle
+    def updateParticlesInformation(self):
+        maximize = (Pso.PSO().minimax == Consts.minimaxType["maximize"])
+        _update_pbest[self.blocks(self.swarmSize),self.threadsPerBlock](self.devPositions,self.devFitness,
+                      self.devPbest,self.devPbestFitness,maximize)
+        self.hostStale = True
+
+        #update topology swarm information
+        pbestFitness = self.devPbestFitness.copy_to_host(self.pbestFitness)
+        if maximize:
+            best = pbestFitness.argmax()
+            if pbestFitness[best] > pbestFitness[self.bestIndex]:
+                self.bestIndex = best
+        else:
+            best = pbestFitness.argmin()
+            if pbestFitness[best] < pbestFitness[self.bestIndex]:
+                self.bestIndex = best
+        self.clearFlags()
+
+    #Copies the final swarm state to the host buffers
+    def finalize(self):
+        self.synchronize()
+    
+    #Gets the best Particle found so far (copying the state to the host)
+    def getBestParticle(self):
+        self.synchronize()
+        return super(CudaGlobalTopology,self).getBestParticle()
+    
+    #@return returns the swarm (copying the state to the host)
+    def getSwarm(self):
+        self.synchronize()
+        return super(CudaGlobalTopology,self).getSwarm()
+    
+    #Do the statistical analysis of the swarm (copying the state to the host)
+    def statistics(self):
+        if self.statted: return
+        self.synchronize()
+        super(CudaGlobalTopology,self).statistics()
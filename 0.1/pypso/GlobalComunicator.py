@@ -28,75 +28,81 @@ limitations under the License.
 from pypso import Communicator
 from pypso import Pso
 from pypso import Consts
-import random
-from pypso import Util
-import math
+import numpy as np
+
+#Moves the swarm one step, updating the velocities and positions in place
+#v = w * v + c1 * r1 * (pbest - x) + c2 * r2 * (gbest - x)
+#The velocity is limited to [-vmax,vmax] and reflected at the position bounds.
+def _pso_step_numpy(pos,vel,pbest,gbest,w,c1,c2,vmax,plo,phi,rand1,rand2):
+    vel *= w
+    vel += c1 * rand1 * (pbest - pos)
+    vel += c2 * rand2 * (gbest - pos)
+    np.clip(vel,-vmax,vmax,out=vel)
+    pos += vel
+    outside = (pos > phi) | (pos < plo)
+    np.clip(pos,plo,phi,out=pos)
+    vel[outside] *= -1
+
+#Same as _pso_step_numpy, written as a loop to be compiled by Numba
+def _pso_step_loop(pos,vel,pbest,gbest,w,c1,c2,vmax,plo,phi,rand1,rand2):
+    n, dimensions = pos.shape
+    for i in prange(n):
+        for d in range(dimensions):
+            v = w * vel[i,d] + c1 * rand1[i,d] * (pbest[i,d] - pos[i,d]) + c2 * rand2[i,d] * (gbest[d] - pos[i,d])
+            v = min(max(v,-vmax[d]),vmax[d])
+            x = pos[i,d] + v
+            if x > phi[d]:
+                x = phi[d]
+                v = -v
+            elif x < plo[d]:
+                x = plo[d]
+                v = -v
+            vel[i,d] = v
+            pos[i,d] = x
+
+#Use the compiled kernel if Numba is available
+try:
+    from numba import njit, prange
+    _pso_step = njit(parallel=True,fastmath=True,cache=True)(_pso_step_loop)
+except ImportError:
+    prange = xrange
+    _pso_step = _pso_step_numpy
+
+
 ##Communicator used by Global topology
 class GlobalCommunicator(Communicator.Communicator):    
 
     #@OVERRIDE
-    def updateParticlePosition(self,particle,topology,c1,c2):
-        rand = random.Random()
-        
-        for i in xrange(len(particle.getPosition())):
-            
-            #Update velocity 
-            if Pso.PSO().psoType == Consts.psoType["BASIC"]:
-                particle.getVelocity()[i] = particle.getVelocity()[i] + c1 * rand.random() * (particle.getownBestPosition()[i] - particle.getPosition()[i]) + \
-                                             c2 * rand.random() * (topology.getBestParticle().getownBestPosition()[i] - particle.getPosition()[i])
-            elif Pso.PSO().psoType == Consts.psoType["INERTIA"]:
-                print 'not yet implemented'
-                #particle.getVelocity()[i] = PsoImpl.getInstance().getInertiaFactor() * particle.getVelocity()[i] + c1 * random1.nextDouble() * (particle.getPPosition()[i] - particle.getPosition()[i]) + c2
-                #        * random2.nextDouble() * (topology.getPGParticle().getPPosition()[i] - particle.getPosition()[i]);
-            elif Pso.PSO().psoType == Consts.psoType["CONSTRICTED"]:
-                fi = c1 + c2
-                k = 2.0 / abs(2.0 - fi - math.sqrt(math.pow(fi,2) - 4 * fi))
-                particle.getVelocity()[i] = k * (particle.getVelocity()[i] + c1 * rand.random() * (particle.getownBestPosition()[i] - particle.getPosition()[i]) + \
-                                                 c2 * rand.random() * (topology.getBestParticle().getownBestPosition()[i] - particle.getPosition()[i]))                                                
-            else:
-                Util.raiseException("PsoType not yet implemented.",TypeError)
-            
-            #Velocity limit
-            if particle.getVelocity()[i] > Pso.PSO().velocityBounds[i]:
-                particle.getVelocity()[i] = Pso.PSO().velocityBounds[i]
-            elif particle.getVelocity()[i] < (Pso.PSO().velocityBounds[i] * (-1)):
-                particle.getVelocity()[i] = Pso.PSO().velocityBounds[i] * (-1)
-                
-            #Update position
-            particle.getPosition()[i] = particle.getPosition()[i] + particle.getVelocity()[i]
-            
-            #Search space limit
-            if particle.getPosition()[i] > Pso.PSO().positionBounds[i][1]:
-                particle.getPosition()[i] = Pso.PSO().positionBounds[i][1]
-                particle.getVelocity()[i] = particle.getVelocity()[i] * (-1)
-            elif particle.getPosition()[i] < Pso.PSO().positionBounds[i][0]:
-                particle.getPosition()[i] = Pso.PSO().positionBounds[i][0]
-                particle.getVelocity()[i] = particle.getVelocity()[i] * (-1)
+    def updateSwarmPosition(self,topology,w,c1,c2):
+        pso = Pso.PSO()
+        positions = topology.positions
+        r1, r2 = pso.rng.random_sample((2,) + positions.shape).astype(positions.dtype,copy=False)
+        bounds = topology.positionBounds
+        _pso_step(positions,topology.velocities,topology.pbest,topology.pbest[topology.bestIndex],
+                  w,c1,c2,topology.velocityBounds,bounds[:,0],bounds[:,1],r1,r2)
     
     
     
     
     #@OVERRIDE
-    def updateParticleInformation(self,particle,topology):
-        if Pso.PSO().minimax == Consts.minimaxType["maximize"]:
-            #update globalParticle information
-            if (particle.getFitness() > particle.getownBestFitness()):
-                particle.setownBestFitness(particle.getFitness())
-                particle.setownBestPosition(particle.getPosition())
-            #update topology swarm information
-            if particle.getownBestFitness() > topology.getBestParticle().getownBestFitness():
-                topology.setBestParticle(particle)
-            
+    def updateSwarmInformation(self,topology):
+        fitness, pbestFitness = topology.fitness, topology.pbestFitness
+        maximize = (Pso.PSO().minimax == Consts.minimaxType["maximize"])
+        
+        #update particles information
+        if maximize:
+            improved = fitness > pbestFitness
         else:
-            #update global Particle information
-            if (particle.getFitness() < particle.getownBestFitness()):
-                particle.setownBestFitness(particle.getFitness())
-                particle.setownBestPosition(particle.getPosition())
-            #update topology swarm information
-            if particle.getownBestFitness() < topology.getBestParticle().getownBestFitness():
-                topology.setBestParticle(particle)
-            
+            improved = fitness < pbestFitness
+        pbestFitness[improved] = fitness[improved]
+        topology.pbest[improved] = topology.positions[improved]
         
-    
-    
-
+        #update topology swarm information
+        if maximize:
+            best = pbestFitness.argmax()
+            if pbestFitness[best] > pbestFitness[topology.bestIndex]:
+                topology.bestIndex = best
+        else:
+            best = pbestFitness.argmin()
+            if pbestFitness[best] < pbestFitness[topology.bestIndex]:
+                topology.bestIndex = best
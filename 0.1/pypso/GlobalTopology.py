@@ -27,7 +27,6 @@ limitations under the License.
 
 from pypso import Topology
 from pypso import GlobalComunicator
-from pypso import Pso
 
 
 ##Class Global Topology - The Star Topology
@@ -54,16 +53,13 @@ class GlobalTopology(Topology.Topology):
     
     #Updates the particles information
     def updateParticlesInformation(self):
-        for particle in self.swarm:
-            particle.setCommunicator(self.communicator)
-            particle.getCommunicator().updateParticleInformation(particle,self)
+        self.communicator.updateSwarmInformation(self)
         self.clearFlags()
     
     #Updates the particles position
-    def updateParticlesPosition(self):
-        for particle in self.swarm:
-            particle.getCommunicator().updateParticlePosition(particle,self,Pso.PSO().C1,Pso.PSO().C2)
-            particle.evaluateFitness()
+    def updateParticlesPosition(self,w,c1,c2):
+        self.communicator.updateSwarmPosition(self,w,c1,c2)
+        self.evaluateFitness()
     
     
     
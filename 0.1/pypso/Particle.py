@@ -23,8 +23,10 @@ limitations under the License.
     This module have the class which every particle of the swarm extends,
     If you are planning to create a new representation, you must take a
     inside look into this module.
+    
+    The particle state is stored in the topology buffers, the particle is
+    only a view over its row (see Topology.Topology).
 '''
-import random
 from pypso import Pso
 
 ##Particle Class - The base of all particle representation
@@ -35,44 +37,37 @@ class Particle(object):
     communicator = None
 
     #Class Constructor
-    def __init__(self):
-        
-        #Current velocity.
-        self.velocity = []
-        #Current position.
-        self.position = []
-        #Best fitness founded by particle
-        self.ownBestFitness = 0.0
-        #Best position founded by particle.
-        self.ownBestPosition = []
-        #Current fitness
-        self.fitness = 0.0
+    #@param topology: The topology which holds the particle state.
+    #@param index: The particle row inside the topology buffers.
+    def __init__(self,topology,index):
+        self.topology = topology
+        self.index = index
     
+    #Current velocity.
+    velocity = property(lambda self: self.topology.velocities[self.index])
+    #Current position.
+    position = property(lambda self: self.topology.positions[self.index])
+    #Best position founded by particle.
+    ownBestPosition = property(lambda self: self.topology.pbest[self.index])
     
-    #Initialize the particles.
-    #@param dimensions: Number of dimensions used.
-    def initialize(self,dimensions):
-        for i in xrange(dimensions):
-            #Fill positions from low up to high position bound.
-            rand = self.randomPosition(Pso.PSO().initialPositionBounds[i][0],Pso.PSO().initialPositionBounds[i][1])
-            self.position.append(rand)
-            self.ownBestPosition.append(rand)
-            #Velocities from 0.0 up to velocity bound
-            rand = abs(random.uniform(0.0,Pso.PSO().velocityBounds[i]))
-            self.velocity.append(rand)
-        #Calculate the fitness
-        self.evaluateFitness()
-        self.ownBestFitness = self.fitness
+    #Current fitness
+    def _getFitness(self):
+        return self.topology.fitness[self.index]
+    def _setFitness(self,fitness):
+        self.topology.fitness[self.index] = fitness
+    fitness = property(_getFitness,_setFitness)
+    
+    #Best fitness founded by particle
+    def _getOwnBestFitness(self):
+        return self.topology.pbestFitness[self.index]
+    def _setOwnBestFitness(self,ownBestFitness):
+        self.topology.pbestFitness[self.index] = ownBestFitness
+    ownBestFitness = property(_getOwnBestFitness,_setOwnBestFitness)
     
     
     #Evaluates the particle fitness
     def evaluateFitness(self):   
         self.fitness = Pso.PSO().function(self.position)
-    #Get an random Position
-    #@param min: The min value
-    #@param max: The max value
-    def randomPosition(self,min,max):
-        return min + (max - min) * (random.random())
     
     #Get the fitness score of the particle
     #@return fitness
@@ -116,13 +111,13 @@ class Particle(object):
     #Set the own best position
     #@param ownBestPosition : The best position
     def setownBestPosition(self,ownBestPosition):
-        self.ownBestPosition = ownBestPosition[:]     
+        self.ownBestPosition[:] = ownBestPosition
     
     #Clear best position and fitness of the particle
     def resetStats(self):
         self.ownBestFitness = 0.0
         self.fitness = 0.0
-        self.ownBestPosition = []
+        self.ownBestPosition[:] = 0.0
     
     #String represenation of the Particle
     def __repr__(self):
@@ -131,6 +126,3 @@ class Particle(object):
         ret+= "\tBestFitness:\t\t\t %s\n" % (self.ownBestFitness,)
         ret+= "\tBestPosition:\t\t %s\n\n" % (self.ownBestPosition,)
         return ret
-        
-        
-
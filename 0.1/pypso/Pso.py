@@ -26,9 +26,14 @@ limitations under the License.
 """
 
 import Consts
-import random
-from time import time
+try:
+    from time import perf_counter
+except ImportError:
+    #Python < 3.3: the best timer available for the platform
+    from timeit import default_timer as perf_counter
 import Util
+import math
+import numpy as np
 from sys import exit as sys_exit
 from sys import platform as sys_platform
 
@@ -36,254 +41,363 @@ from sys import platform as sys_platform
 if sys_platform[:3] == "win":
    import msvcrt
 
+#Constants used by the PSO Engine checks
+_INERTIA_PSO = Consts.psoType["INERTIA"]
+_CONSTRICTED_PSO = Consts.psoType["CONSTRICTED"]
+_PSO_TYPE_VALUES = frozenset(Consts.psoType.values())
+_MINMAX_VALUES = frozenset(Consts.minimaxType.values())
+_DTYPE_VALUES = frozenset([np.dtype(np.float32),np.dtype(np.float64)])
+
+#The specialized steps of the PSO Engine, one for each Pso Type.
+#checkParametersSet() selects the step used by constructSolution(), the
+#topology moves the swarm with v = w * v + c1 * r1 * (pbest - x) + c2 * r2 * (gbest - x)
+
+#Does one step of the BASIC Pso Type (w = 1.0)
+#@param pso: the PSO Engine
+#@return True if the last time step was reached
+def _step_basic(pso):
+    topology = pso.topology
+    topology.step(1.0,pso.C1,pso.C2)
+    topology.storeBestParticle()
+    pso.currentStep += 1
+    return (pso.currentStep == pso.timeSteps)
+
+#Does one step of the CONSTRICTED Pso Type (w = k, c1 = k * C1, c2 = k * C2)
+#@param pso: the PSO Engine
+#@return True if the last time step was reached
+def _step_constricted(pso):
+    topology = pso.topology
+    k = pso._constriction
+    topology.step(k,k * pso.C1,k * pso.C2)
+    topology.storeBestParticle()
+    pso.currentStep += 1
+    return (pso.currentStep == pso.timeSteps)
+
+#Does one step of the INERTIA Pso Type (w from the inertia schedule)
+#@param pso: the PSO Engine
+#@return True if the last time step was reached
+def _step_inertia(pso):
+    topology = pso.topology
+    pso.inertiaFactor = pso._inertia_schedule[pso.currentStep]
+    topology.step(pso.inertiaFactor,pso.C1,pso.C2)
+    topology.storeBestParticle()
+    pso.currentStep += 1
+    return (pso.currentStep == pso.timeSteps)
+
+_steps = { Consts.psoType["BASIC"] : _step_basic,
+           Consts.psoType["CONSTRICTED"] : _step_constricted,
+           Consts.psoType["INERTIA"] : _step_inertia
+         }
+
 #The PSO Core
+#There is only one PSO Engine: PSO() always returns the same instance.
 class PSO(object):
     
     #The Singleton instance
     _iInstance = None
     
-    class Singleton:        
-        ##Constructor of PSO
-        #@param seed
-        #@param interactiveMode  
-        def __init__(self,seed=None,interactiveMode=True):
-            #Random seed
-            random.seed(seed)
-            #Pso type used by particle.
-            self.psoType = Consts.CDefPsoType 
-            #Topology used (Must be created by using Topology base class)
-            self.topology = None
-            #Cognitive and Social Coefficients
-            self.C1,self.C2 = Consts.CDefCoefficients
-            #Time steps
-            self.timeSteps = Consts.CDefSteps
-            #Interactive Mode (True or False)
-            self.interactiveMode = interactiveMode
-            #Current step
-            self.currentStep = 0
-            #Fitness Evaluator
-            self.function = None
-            #Inertia Factor Minus
-            self.inertiaFactorMinus = None
-            #Inertia coefficient
-            self.inertiaFactor = None
-            #Time initial
-            self.time_init = None
-            #List of position boundary
-            self.positionBounds = []
-            #List of initial position boundary arrays
-            self.initialPositionBounds = []
-            #List of absolute velocity bounds 
-            self.velocityBounds = []
-            #Optimization type
-            self.minimax = Consts.minimaxType["minimize"]
-            #print "A PSO Engine was created, timeSteps=% d" % ( self.timeSteps, )
-        
-        #Set the function fitness
-        def setFunction(self,function):
-            self.function = function
-        
-        #@return the function
-        def getFunction(self):
-            return self.function
-        
-        #Sets the optimization type (Minimize or Maximize)
-        #@param minima: The optimization type
-        def setMinimax(self,minimax):
-            if minimax not in Consts.minimaxType.values():
-                Util.raiseException("Optimization type must be Maximize or Minimize !",TypeError)
-            self.minimax = minimax
-        
-        #Sets the psoType, use Consts.psoType (Basic, Constricted , Inertia)
-        #@param psoType: The PSO type, from Consts.psoType
-        def setPsoType(self,psoType):
-            if psoType not in Consts.psoType.values():
-                Util.raiseException("PsoType must be implemented !",TypeError)
-            self.psoType = psoType
-        
-        #@return  the PsoType
-        def getPsoType(self):
-            return self.psoType
-        
-        #Sets the Topology and its parameters
-        #@param topology: The current topology
-        def setTopology(self,topology):
-            self.topology = topology
-            
-        #@return the topology
-        def getTopology(self):
-            return self.topology
-        
-        #Initialize position and velocity bounds
-        #@param dimensions the number of dimensions used
-        def initializeBounds(self,dimensions):
-            for i in xrange(dimensions):
-                self.initialPositionBounds.append((0.0,0.0))
-                self.positionBounds.append((0.0,0.0))
-                self.velocityBounds.append(0.0)
-        
-        #Defines the entire search space
-        #@param firstDimension firts dimension to set bound
-        #@param lastDimension last dimension to set bound
-        #@param minValue minimum/maximum bound value
-        def definePositionBounds(self,firstDimension,lastDimension,minMaxValue):
-            if type(minMaxValue) is not tuple:
-                Util.raiseException("minMaxValue type must be a tuple (a,b).", TypeError)
-            for i in range(firstDimension,lastDimension):
-                self.positionBounds[i] = minMaxValue
-        
-        #Defines the search space region of the initial particles
-        #@param firstDimension firts dimension to set bound
-        #@param lastDimension last dimension to set bound
-        #@param minValue minimum/maximum bound value
-        def defineInitialPositionBounds(self,firstDimension,lastDimension,minMaxValue):
-            if type(minMaxValue) is not tuple:
-                Util.raiseException("minMaxValue type must be a tuple (a,b).", TypeError)
-            for i in range(firstDimension,lastDimension):
-                self.initialPositionBounds[i] = minMaxValue
-        
-        #@return the Time steps
-        def getTimeSteps(self):
-            return self.timeSteps
-        
-        #Sets the number of steps to converge
-        #@param num_steps: the number of steps
-        def setTimeSteps(self,num_steps):
-            if num_steps < 1:
-                Util.raiseException("Number of steps must be >=1",ValueError)
-            self.timeSteps = num_steps
-        
-        #Defines the velocity bounds
-        #@param firstDimension first dimension to be set
-        #@param lastDimension last dimension to be set
-        #@param value bound value
-        def defineVelocityBounds(self,firstDimensiom,lastDimensiom,value):
-            for i in range(firstDimensiom,lastDimensiom):
-                self.velocityBounds[i] = value
-        
-        #Define the  inertiaFactorStart/End to set
-        #@param inertiaFactorStart: The initial inertia factor coefficient
-        #@param  inertiaFactorEnd: The  inertia factor coefficient at the end
-        def setInitialInertiaFactor(self,inertiaFactorStart = Consts.CDefInertiaFactorStart, inertiaFactorEnd = Consts.CDefInertiaFactorEnd):
-            if self.psoType == Consts.psoType["INERTIA"]:
-                self.inertiaFactorMinus = math.abs((inertiaFactorStart - inertiaFactorEnd)) / self.timeSteps
-                self.inertiaFactor = inertiaFactorStart
+    #The attributes of the PSO Engine (fixed layout, no instance __dict__)
+    __slots__ = ('rng','psoType','topology','C1','C2','timeSteps','_pct_scale',
+                 'interactiveMode','currentStep','function','n_processes','dtype',
+                 'inertiaFactor','_inertia_schedule','_constriction',
+                 '_stepSolution','time_init','positionBounds','initialPositionBounds',
+                 'velocityBounds','minimax')
+    
+    ##Returns the PSO Engine instance, creating it on the first call
+    #The n_processes and dtype of an existing instance are changed with
+    #setNumProcesses() and setDtype(), passing other values here raises ValueError.
+    #@param seed
+    #@param interactiveMode
+    #@param n_processes: number of processes used to evaluate the fitness (default 1)
+    #@param dtype: the float type of the particles position/velocity (np.float64 (default) or np.float32)
+    def __new__(cls,seed=None,interactiveMode=True,n_processes=None,dtype=None):
+        #Check whether we already have an instance
+        if PSO._iInstance is None:
+            if n_processes is None: n_processes = 1
+            if dtype is None: dtype = np.float64
+            #Create and remember the instance
+            PSO._iInstance = object.__new__(cls)
+            PSO._iInstance.__setup(seed,interactiveMode,n_processes,dtype)
+        else:
+            pso = PSO._iInstance
+            if n_processes is not None and n_processes != pso.n_processes:
+                Util.raiseException("The PSO Engine already exists, use setNumProcesses() to change n_processes.",ValueError)
+            if dtype is not None and np.dtype(dtype) != pso.dtype:
+                Util.raiseException("The PSO Engine already exists, use setDtype() to change dtype.",ValueError)
+        return PSO._iInstance
+    
+    ##Constructor of PSO (only called once, by __new__)
+    #@param seed
+    #@param interactiveMode  
+    #@param n_processes
+    #@param dtype
+    def __setup(self,seed,interactiveMode,n_processes,dtype):
+        #Random number generator (seeded), used by the topology and communicators
+        self.rng = np.random.RandomState(seed)
+        #Pso type used by particle.
+        self.psoType = Consts.CDefPsoType 
+        #Topology used (Must be created by using Topology base class)
+        self.topology = None
+        #Cognitive and Social Coefficients
+        self.C1,self.C2 = Consts.CDefCoefficients
+        #Time steps
+        self.timeSteps = Consts.CDefSteps
+        #Scale factor of the step percent (100.0 / timeSteps)
+        self._pct_scale = 100.0 / self.timeSteps
+        #Interactive Mode (True or False)
+        self.interactiveMode = interactiveMode
+        #Current step
+        self.currentStep = 0
+        #Fitness Evaluator
+        self.function = None
+        #Number of processes used to evaluate the fitness (1 is serial)
+        self.setNumProcesses(n_processes)
+        #Float type of the particles position/velocity (the fitness is always np.float64)
+        self.setDtype(dtype)
+        #Inertia coefficient
+        self.inertiaFactor = None
+        #Inertia coefficient of each time step (Only used by INERTIA Pso Type)
+        self._inertia_schedule = None
+        #Constriction factor k (Only used by CONSTRICTED Pso Type)
+        self._constriction = None
+        #Step function of the Pso Type (set by checkParametersSet)
+        self._stepSolution = None
+        #Time initial
+        self.time_init = None
+        #Position boundary [dimensions,2]
+        self.positionBounds = np.zeros((0,2))
+        #Initial position boundary [dimensions,2]
+        self.initialPositionBounds = np.zeros((0,2))
+        #Absolute velocity bounds [dimensions]
+        self.velocityBounds = np.zeros(0)
+        #Optimization type
+        self.minimax = Consts.minimaxType["minimize"]
+        #print "A PSO Engine was created, timeSteps=% d" % ( self.timeSteps, )
+    
+    #Set the function fitness
+    def setFunction(self,function):
+        self.function = function
+    
+    #@return the function
+    def getFunction(self):
+        return self.function
+    
+    #Sets the optimization type (Minimize or Maximize)
+    #@param minima: The optimization type
+    def setMinimax(self,minimax):
+        if minimax not in _MINMAX_VALUES:
+            Util.raiseException("Optimization type must be Maximize or Minimize !",TypeError)
+        self.minimax = minimax
+    
+    #Sets the psoType, use Consts.psoType (Basic, Constricted , Inertia)
+    #@param psoType: The PSO type, from Consts.psoType
+    def setPsoType(self,psoType):
+        if psoType not in _PSO_TYPE_VALUES:
+            Util.raiseException("PsoType must be implemented !",TypeError)
+        self.psoType = psoType
+        #The step of the new Pso Type is selected again by checkParametersSet()
+        self._stepSolution = None
+    
+    #@return  the PsoType
+    def getPsoType(self):
+        return self.psoType
+    
+    #Sets the Topology and its parameters
+    #@param topology: The current topology
+    def setTopology(self,topology):
+        self.topology = topology
         
-        #Updates the inertia factor (Only used by INERTIA Pso Type)
-        def updateInertiaFactor(self):
-            self.inertiaFactor = self.inertiaFactor = self.inertiaFactorMinus
-           
-        #The string representation of the PSO Engine"
-        def __repr__(self):
-            ret =   "- PSO-%s-%s Execution\n" % (self.topology,self.psoType)
-            ret +=  "\tSwarm Size:\t %d\n" % (self.topology.swarmSize,)
-            ret +=  "\tDimensions:\t %d\n" % (self.topology.dimensions,)
-            ret +=  "\tTime Steps:\t\t %d\n" % (self.timeSteps,)      
-            ret +=  "\tCurrent Step:\t %d\n" % (self.currentStep,)
-            ret +=  "\tFunction:\t  %s\n" % (self.function,)
-            ret +="\n"
-            return ret
+    #@return the topology
+    def getTopology(self):
+        return self.topology
+    
+    #Initialize position and velocity bounds
+    #@param dimensions the number of dimensions used
+    def initializeBounds(self,dimensions):
+        self.initialPositionBounds = np.zeros((dimensions,2))
+        self.positionBounds = np.zeros((dimensions,2))
+        self.velocityBounds = np.zeros(dimensions)
+    
+    #Defines the entire search space
+    #@param firstDimension firts dimension to set bound
+    #@param lastDimension last dimension to set bound
+    #@param minValue minimum/maximum bound value
+    def definePositionBounds(self,firstDimension,lastDimension,minMaxValue):
+        if type(minMaxValue) is not tuple:
+            Util.raiseException("minMaxValue type must be a tuple (a,b).", TypeError)
+        self.positionBounds[firstDimension:lastDimension] = minMaxValue
+    
+    #Defines the search space region of the initial particles
+    #@param firstDimension firts dimension to set bound
+    #@param lastDimension last dimension to set bound
+    #@param minValue minimum/maximum bound value
+    def defineInitialPositionBounds(self,firstDimension,lastDimension,minMaxValue):
+        if type(minMaxValue) is not tuple:
+            Util.raiseException("minMaxValue type must be a tuple (a,b).", TypeError)
+        self.initialPositionBounds[firstDimension:lastDimension] = minMaxValue
+    
+    #@return the Time steps
+    def getTimeSteps(self):
+        return self.timeSteps
+    
+    #Sets the number of steps to converge
+    #@param num_steps: the number of steps
+    def setTimeSteps(self,num_steps):
+        if num_steps < 1:
+            Util.raiseException("Number of steps must be >=1",ValueError)
+        self.timeSteps = num_steps
+        self._pct_scale = 100.0 / num_steps
+        #Keep the inertia schedule with one value per time step
+        if self._inertia_schedule is not None:
+            self.setInitialInertiaFactor(self._inertia_schedule[0],self._inertia_schedule[-1])
+    
+    #Sets the number of processes used to evaluate the fitness
+    #@param n_processes: the number of processes (1 is serial)
+    def setNumProcesses(self,n_processes):
+        if n_processes < 1:
+            Util.raiseException("Number of processes must be >=1",ValueError)
+        self.n_processes = n_processes
+    
+    #@return the number of processes used to evaluate the fitness
+    def getNumProcesses(self):
+        return self.n_processes
+    
+    #Sets the float type of the particles position/velocity, it is used
+    #by the topology when the swarm is created
+    #@param dtype: np.float64 or np.float32
+    def setDtype(self,dtype):
+        dtype = np.dtype(dtype)
+        if dtype not in _DTYPE_VALUES:
+            Util.raiseException("dtype must be np.float32 or np.float64 !",TypeError)
+        self.dtype = dtype
+    
+    #@return the float type of the particles position/velocity
+    def getDtype(self):
+        return self.dtype
+    
+    #Defines the velocity bounds
+    #@param firstDimension first dimension to be set
+    #@param lastDimension last dimension to be set
+    #@param value bound value
+    def defineVelocityBounds(self,firstDimensiom,lastDimensiom,value):
+        self.velocityBounds[firstDimensiom:lastDimensiom] = value
+    
+    #Define the  inertiaFactorStart/End to set
+    #@param inertiaFactorStart: The initial inertia factor coefficient
+    #@param  inertiaFactorEnd: The  inertia factor coefficient at the end
+    def setInitialInertiaFactor(self,inertiaFactorStart = Consts.CDefInertiaFactorStart, inertiaFactorEnd = Consts.CDefInertiaFactorEnd):
+        if self.psoType == _INERTIA_PSO:
+            #The inertia factor decreases linearly over the time steps
+            self._inertia_schedule = np.linspace(inertiaFactorStart,inertiaFactorEnd,self.timeSteps)
+            self.inertiaFactor = inertiaFactorStart
+       
+    #The string representation of the PSO Engine"
+    def __repr__(self):
+        ret =   "- PSO-%s-%s Execution\n" % (self.topology,self.psoType)
+        ret +=  "\tSwarm Size:\t %d\n" % (self.topology.swarmSize,)
+        ret +=  "\tDimensions:\t %d\n" % (self.topology.dimensions,)
+        ret +=  "\tTime Steps:\t\t %d\n" % (self.timeSteps,)      
+        ret +=  "\tCurrent Step:\t %d\n" % (self.currentStep,)
+        ret +=  "\tFunction:\t  %s\n" % (self.function,)
+        ret +="\n"
+        return ret
+    
+    #Do all the PSO execution until the termination criteria, accepts
+    #the freq_stats (default is 0 to dump statistics at n-timeStep
+    #@param freq_stats: If greater than 0, the statistics will be printed every freq_stats time Step.
+    def execute(self,freq_stats=0):
+        #Check the parameters set
+        self.checkParametersSet()
+        #Start time
+        self.time_init = perf_counter()
+        #Worker processes used by the topology to evaluate the fitness,
+        #created once for the whole execution
+        pool = None
+        if self.n_processes > 1:
+            import multiprocessing
+            pool = multiprocessing.Pool(self.n_processes)
+            self.topology.mapper = pool.map
         
-        #Do all the PSO execution until the termination criteria, accepts
-        #the freq_stats (default is 0 to dump statistics at n-timeStep
-        #@param freq_stats: If greater than 0, the statistics will be printed every freq_stats time Step.
-        def execute(self,freq_stats=0):
-            #Check the parameters set
-            self.checkParametersSet()
-            #Start time
-            self.time_init = time()
+        try:
             #Initialize the PSO Engine
             self.initialize()
             
             print "Starting loop over evolutionary algorithm."
             
-            try:
-                while not self.constructSolution():
-                    if freq_stats != 0:
-                        if (self.currentStep % freq_stats == 0) or (self.currentStep == 1):
-                            self.printStats()
-                        if self.interactiveMode:
-                            if sys_platform[:3] == "win":
-                                if msvcrt.kbhit():
-                                    if ord(msvcrt.getch()) == Consts.CDefESCKey:
-                                        import pypso.Interaction
-                                        interact_banner = "## PyPSO v.%s - Interactive Mode ##\nPress CTRL-Z to quit interactive mode." % (pypso.__version__,)
-                                        session_locals = {  "pso_engine"  : self,
-                                                            "swarm" : self.getSwarm(),
-                                                            "pypso"   : pypso,
-                                                            "it"         : pypso.Interaction}
-                                        print
-                                        code.interact(interact_banner, local=session_locals)
-                                
-            except KeyboardInterrupt:
-                print "\n\tA break was detected, you have interrupted the evolution !\n"
-     
+            #Local references used by the main loop
+            stepSolution = self._stepSolution
+            
+            #Time steps where the statistics are printed
+            statsSteps = set()
+            #Keyboard polling functions of the interactive mode (Windows only)
+            kbhit = getch = None
             if freq_stats != 0:
-                self.printStats()
-                self.printTimeElapsed()
-                                    
-        #Constructs a solution (one step of the proccess).
-        def constructSolution(self):
-            self.topology.updateParticlesPosition()
-            self.topology.updateParticlesInformation()
-            #print 'Updating topology position and information.'
-        
-            if self.psoType == Consts.psoType["INERTIA"]:
-                self.updateInertiaFactor()
-                print "Updated the inertia factor"
-        
-            self.currentStep += 1
-        
-            #print "The swarm update %d was finished."  % (self.currentStep,)
-            return (self.currentStep == self.timeSteps)        
-              
-        #Initializes the PSO Engine. Create and initialize the swarm   
-        def initialize(self):
-            self.topology.initialize()
-            print "The PSO Engine was initialized !"
-        
-        #Check all the parameters set before running the engine.    
-        def checkParametersSet(self):
-            if not self.topology or not self.function:
-                Util.raiseException("Topology/Evaluation fuction not yet defined.", TypeError)
-            if self.psoType == Consts.psoType["INERTIA"]:
-                if not self.inertiaFactorMinus or not self.inertiaFactor:
-                    Util.raiseException("Set the setInitialInertiaFactor() for the Inertia weight.", TypeError)
-            if not self.initialPositionBounds or not self.velocityBounds or not self.positionBounds:
-                 Util.raiseException("The Position/Velocity/InitialPos Bounds not yet defined.", TypeError)
-        
-        #Print the swarm statistics
-        def printStats(self):
-            percent = self.currentStep * 100 / float(self.timeSteps)
-            message = "Step: %d (%.2f%%):" % (self.currentStep, percent)
-            print message,
-            self.topology.statistics()
-            self.topology.printStats()
+                statsSteps = set(xrange(0,self.timeSteps,freq_stats))
+                statsSteps.add(1)
+                if self.interactiveMode and sys_platform[:3] == "win":
+                    kbhit, getch = msvcrt.kbhit, msvcrt.getch
+            
+            while not stepSolution(self):
+                if self.currentStep in statsSteps:
+                    self.printStats()
+                if kbhit is not None and kbhit():
+                    if ord(getch()) == Consts.CDefESCKey:
+                        import pypso.Interaction
+                        interact_banner = "## PyPSO v.%s - Interactive Mode ##\nPress CTRL-Z to quit interactive mode." % (pypso.__version__,)
+                        session_locals = {  "pso_engine"  : self,
+                                            "swarm" : self.getSwarm(),
+                                            "pypso"   : pypso,
+                                            "it"         : pypso.Interaction}
+                        print
+                        code.interact(interact_banner, local=session_locals)
+                            
+        except KeyboardInterrupt:
+            print "\n\tA break was detected, you have interrupted the evolution !\n"
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+                self.topology.mapper = map
         
-        #Shows the time elapsed since the beginning of the solution construction
-        def printTimeElapsed(self):
-            print "Total time elapsed: %.3f seconds." % (time()-self.time_init)
-
-
-
-    def __init__(self):
-        #Check whether we already have an instance
-        if PSO._iInstance is None:
-            #Create and remember the instance
-            PSO._iInstance = PSO.Singleton()
-        #Store instane reference as the only member  in the handle
-        self.__dict__['EventHandler_instance'] = PSO._iInstance
+        #Brings the final swarm state to the topology buffers
+        self.topology.finalize()
+ 
+        if freq_stats != 0:
+            self.printStats()
+            self.printTimeElapsed()
+                                
+    #Constructs a solution (one step of the proccess).
+    #The step of the Pso Type is selected by checkParametersSet().
+    def constructSolution(self):
+        if self._stepSolution is None:
+            Util.raiseException("Call checkParametersSet() before constructing a solution.", TypeError)
+        return self._stepSolution(self)
+          
+    #Initializes the PSO Engine. Create and initialize the swarm   
+    def initialize(self):
+        self.topology.initialize()
+        print "The PSO Engine was initialized !"
     
-    ##Delegate access to implementation
-    #@param attr Attribute wanted.
-    #@return Attribute
-    def __getattr__(self,aAttr):
-        return getattr(self._iInstance,aAttr)
+    #Check all the parameters set before running the engine.    
+    def checkParametersSet(self):
+        if not self.topology or not self.function:
+            Util.raiseException("Topology/Evaluation fuction not yet defined.", TypeError)
+        if self.psoType == _INERTIA_PSO:
+            if self._inertia_schedule is None:
+                Util.raiseException("Set the setInitialInertiaFactor() for the Inertia weight.", TypeError)
+        if self.initialPositionBounds.size == 0 or self.velocityBounds.size == 0 or self.positionBounds.size == 0:
+             Util.raiseException("The Position/Velocity/InitialPos Bounds not yet defined.", TypeError)
+        if self.psoType == _CONSTRICTED_PSO:
+            fi = self.C1 + self.C2
+            self._constriction = 2.0 / abs(2.0 - fi - math.sqrt(math.pow(fi,2) - 4 * fi))
+        self._stepSolution = _steps[self.psoType]
     
-    ##Delegate access to implementation
-    def __setattr__(self,aAttr,aValue):
-        return setattr(self._iInstance,aAttr,aValue)
+    #Print the swarm statistics
+    def printStats(self):
+        print "Step: %d (%.2f%%):" % (self.currentStep, self.currentStep * self._pct_scale),
+        self.topology.statistics()
+        self.topology.printStats()
     
-    def __repr__(self):
-        return self._iInstance.__repr__()
-                
+    #Shows the time elapsed since the beginning of the solution construction
+    def printTimeElapsed(self):
+        print "Total time elapsed: %.3f seconds." % (perf_counter()-self.time_init)
@@ -27,7 +27,9 @@ limitations under the License.
 from pypso import SwarmStatistics
 from pypso import TopologyStatistics
 from pypso import Particle
-import math
+from pypso import Pso
+from pypso import Util
+import numpy as np
 
 #A key function to return the fitness score, used by max()/min()
 #@param particle: the particle instance
@@ -43,6 +45,8 @@ def key_bestFitness(particle):
 
 
 ##Class Topology - The container for the particles
+#The swarm state is kept as Structure-of-Arrays buffers (one row per particle),
+#so the communicators can update the whole swarm with a few NumPy operations.
 class Topology(object):
     
     #Communicator used by the particles in this topology. 
@@ -56,10 +60,27 @@ class Topology(object):
         self.swarmSize = 0
         #Number of search space dimensions
         self.dimensions = 0
-        #Swarm used by the topology
+        #Swarm used by the topology (particles are views over the state buffers)
         self.swarm = []
-        #Best particle inside topology
-        self.bestParticle = None
+        #The map function used to evaluate the fitness, replaced by a
+        #multiprocessing.Pool map when the PSO Engine runs with n_processes > 1
+        self.mapper = map
+        #Index of the best particle inside topology
+        self.bestIndex = 0
+        #Current positions [swarmSize,dimensions]
+        self.positions = None
+        #Current velocities [swarmSize,dimensions]
+        self.velocities = None
+        #Best positions founded by each particle [swarmSize,dimensions]
+        self.pbest = None
+        #Current fitness [swarmSize]
+        self.fitness = None
+        #Best fitness founded by each particle [swarmSize]
+        self.pbestFitness = None
+        #Position bounds [dimensions,2] and absolute velocity bounds [dimensions],
+        #with the same float type of the positions
+        self.positionBounds = None
+        self.velocityBounds = None
         # Statistics Flag
         self.statted = False
         #Swarm Statistics (all particles)
@@ -73,26 +94,72 @@ class Topology(object):
         self.createSwarm()
         self.initializeSwarm()
     
-    #Creates the swarm
+    #Creates the swarm, allocating the state buffers of the particles
     def createSwarm(self):
         self.clear()
+        shape = (self.swarmSize,self.dimensions)
+        dtype = Pso.PSO().dtype
+        self.positions = np.empty(shape,dtype=dtype)
+        self.velocities = np.empty(shape,dtype=dtype)
+        self.pbest = np.empty(shape,dtype=dtype)
+        self.fitness = np.empty(self.swarmSize,dtype=np.float64)
+        self.pbestFitness = np.empty(self.swarmSize,dtype=np.float64)
         for i in xrange(self.swarmSize):
-            self.swarm.append(Particle.Particle())
+            self.swarm.append(Particle.Particle(self,i))
         
         
     #Initializes the particles of the swarm
     def initializeSwarm(self):
-        for particle in self.swarm:
-            particle.initialize(self.dimensions)
+        pso = Pso.PSO()
+        rng = pso.rng
+        shape = (self.swarmSize,self.dimensions)
+        initialBounds = pso.initialPositionBounds
+        self.positionBounds = pso.positionBounds.astype(pso.dtype,copy=False)
+        self.velocityBounds = pso.velocityBounds.astype(pso.dtype,copy=False)
+        #Fill positions from low up to high position bound.
+        self.positions[:] = rng.uniform(initialBounds[:,0],initialBounds[:,1],shape)
+        self.pbest[:] = self.positions
+        #Velocities from 0.0 up to velocity bound
+        self.velocities[:] = np.abs(rng.uniform(0.0,self.velocityBounds,shape))
+        #Calculate the fitness
+        self.evaluateFitness()
+        self.pbestFitness[:] = self.fitness
             
-        self.bestParticle = self.swarm[0]
+        self.bestIndex = 0
+    
+    #Evaluates the fitness of all particles
+    def evaluateFitness(self):
+        self.fitness[:] = self.mapper(Pso.PSO().function,self.positions)
     
     #Updates the topology information
     def updateParticlesInformation(self):
         pass
     
     #Updates the topology particles position
-    def updateParticlesPosition(self):
+    #v = w * v + c1 * r1 * (pbest - x) + c2 * r2 * (gbest - x)
+    #@param w : velocity coefficient (inertia/constriction factor)
+    #@param c1 : cognitive coefficient acceleration
+    #@param c2 : social   coefficient acceleration
+    def updateParticlesPosition(self,w,c1,c2):
+        pass
+    
+    #Moves the swarm one step, updating the particles position and information
+    #(one call per step, the position update, the fitness evaluation and the
+    #best positions update are still separate passes over the swarm)
+    #@param w, c1, c2 : the velocity coefficients (see updateParticlesPosition)
+    def step(self,w,c1,c2):
+        self.updateParticlesPosition(w,c1,c2)
+        self.updateParticlesInformation()
+    
+    #Stores the best particle found so far (used by topologies which keep
+    #the best particle history, the default does nothing)
+    def storeBestParticle(self):
+        pass
+    
+    #Finishes the run, called by the PSO Engine after the main loop (used by
+    #topologies which keep the swarm state out of the host buffers, the
+    #default does nothing)
+    def finalize(self):
         pass
     
     #Remove all particles from swarm
@@ -102,7 +169,7 @@ class Topology(object):
     #Gets the best Particle found so far.
     #@return bestParticle: The best particle found.
     def getBestParticle(self):
-        return self.bestParticle
+        return self.swarm[self.bestIndex]
     
     #@return returns the swarm
     def getSwarm(self):
@@ -125,7 +192,7 @@ class Topology(object):
     #Set the best Particle
     #@param particle: The best particle to set
     def setBestParticle(self,particle):
-        self.bestParticle = particle
+        self.bestIndex = particle.index
     
     
     #Returns the string representation of the topology
@@ -140,34 +207,24 @@ class Topology(object):
     #Do the statistical analysis of the swarm and set 'statted' to True
     def statistics(self):
         if self.statted: return
-        fit_sum = 0.0
-        swarm_size = len(self.swarm)
-        for index in xrange(swarm_size):
-            fit_sum += self.swarm[index].fitness
-        self.swarmStats["fitMax"] = max(self.swarm,key=key_fitness).fitness
-        self.swarmStats["fitMin"] = min(self.swarm,key=key_fitness).fitness
-        self.swarmStats["fitAvg"] = fit_sum / float(swarm_size)
+        fitness, bestFitness = self.fitness, self.pbestFitness
+        self.swarmStats["fitMax"] = float(fitness.max())
+        self.swarmStats["fitMin"] = float(fitness.min())
+        self.swarmStats["fitAvg"] = float(fitness.mean())
         
-        bestFit_sum = 0
-        for index in xrange(swarm_size):
-            bestFit_sum += self.swarm[index].ownBestFitness
-        self.swarmStats["bestFitMin"] = min(self.swarm,key=key_bestFitness).ownBestFitness
-        self.swarmStats["bestFitMax"] = max(self.swarm,key=key_bestFitness).ownBestFitness
-        self.swarmStats["bestFitAvg"] = bestFit_sum / float(swarm_size)
+        self.swarmStats["bestFitMin"] = float(bestFitness.min())
+        self.swarmStats["bestFitMax"] = float(bestFitness.max())
+        self.swarmStats["bestFitAvg"] = float(bestFitness.mean())
         
-        tmpvar = 0.0
-        for index in xrange(swarm_size):
-            s = self.swarm[index].ownBestFitness - self.swarmStats["bestFitAvg"]
-            s*=s
-            tmpvar += s
-        tmpvar /= float((len(self.swarm)-1))
+        tmpvar = float(bestFitness.var(ddof=1))
         self.swarmStats["bestFitVar"] = tmpvar
-        self.swarmStats["bestFitDev"] = math.sqrt(tmpvar)
+        self.swarmStats["bestFitDev"] = tmpvar ** 0.5
         
-        self.topologyStats["bestFitness"] = self.bestParticle.ownBestFitness
-        self.topologyStats["bestPosition"] = self.bestParticle.ownBestPosition[:]
-        self.topologyStats["bestPosDim"] = self.bestParticle.ownBestPosition[0]
-        self.topologyStats["position"] = self.bestParticle.position[:]
+        best = self.bestIndex
+        self.topologyStats["bestFitness"] = float(bestFitness[best])
+        self.topologyStats["bestPosition"] = self.pbest[best].tolist()
+        self.topologyStats["bestPosDim"] = float(self.pbest[best,0])
+        self.topologyStats["position"] = self.positions[best].tolist()
         
         
         self.statted = True
@@ -48,6 +48,14 @@ General constants
      >>> minmax = Consts.minimaxType["minimize"]
      >>> minmax = Consts.minimaxType["maximize]
      
+.. attribute:: minimaxTypeName
+
+  The reverse lookup of minimaxType, from the Min/Max type to its name.
+
+  Example:
+     >>> Consts.minimaxTypeName[Consts.minimaxType["minimize"]]
+     'minimize'
+     
 .. attribute:: CDefESCKey
 
    The ESC key ASCII code. Used to start Interactive Mode.
@@ -167,6 +175,7 @@ sortType = {
    "fitness"    : 0,
    "bestFitness" : 1
 }
+sortTypeName = dict([(v,k) for k,v in sortType.items()])
 
 #Required python version 2.5+
 CDefPythonRequire = (2,5)
@@ -193,6 +202,7 @@ psoType = {
    "INERTIA" : 1,
    "CONSTRICTED" : 2
 }
+psoTypeName = dict([(v,k) for k,v in psoType.items()])
 
 #Default PsoType
 CDefPsoType  = psoType["BASIC"]
@@ -205,6 +215,7 @@ CDefSteps = 1000
 minimaxType = { "minimize" : 0,
                 "maximize" : 1
                }
+minimaxTypeName = dict([(v,k) for k,v in minimaxType.items()])
 #Social and Cognitive Coefficients (C1 and C2)
 CDefCoefficients = (2.05,2.05)
 
@@ -37,9 +37,17 @@ the topology base class used to do the particle communication.
 import random
 import Consts
 import code
-from time import time
+import copy
+import threading
+import Queue
+try:
+	from time import perf_counter
+except ImportError:
+	#Python < 3.3: the best timer available for the platform
+	from timeit import default_timer as perf_counter
 from FunctionSlot import FunctionSlot
 from sys import platform as sys_platform
+from sys import exc_info
 
 
 if sys_platform[:3] == "win":
@@ -50,6 +58,12 @@ elif sys_platform[:5] == "linux":
     Util.set_curses_term()
 
 
+#Constants used by the PSO Engine checks
+_INERTIA_PSO = Consts.psoType["INERTIA"]
+_PSO_TYPE_VALUES = frozenset(Consts.psoType.values())
+_MINMAX_VALUES = frozenset(Consts.minimaxType.values())
+
+
 def FitnessScoreCriteria(pso_engine):
 	""" Terminate the evolution using the bestFitness parameter obtained from the particle
 
@@ -149,6 +163,8 @@ class SimplePSO(object):
 		self.C1,self.C2 = Consts.CDefCoefficients
         #Time steps
 		self.timeSteps = Consts.CDefSteps
+		#Scale factor of the step percent (100.0 / timeSteps)
+		self._pct_scale = 100.0 / self.timeSteps
 		#Interactive Mode (True or False)
 		self.interactiveMode = interactiveMode
 		#Current step
@@ -163,6 +179,13 @@ class SimplePSO(object):
 		self.minimax = Consts.minimaxType["minimize"]
 		#Report file adapter 
 		self.reportAdapter = None
+		#Report writer thread and the queue of statistics to be written
+		self._io_thread = None
+		self._io_queue = None
+		#Exception info raised by the report writer thread
+		self._io_error = None
+		#Set by the report writer thread once the report adapter open was tried
+		self._io_opened = None
 		#Step Callback
 		self.stepCallback = FunctionSlot("Step Callback")
 		#Termination Criteria
@@ -179,7 +202,7 @@ class SimplePSO(object):
 		ret +=  "\tSwarm Size:\t %d\n" % (self.topology.swarmSize,)
 		ret +=  "\tTime Steps:\t %d\n" % (self.timeSteps,)      
 		ret +=  "\tCurrent Step:\t %d\n" % (self.currentStep,)
-		ret +=  "\tMinimax Type:\t %s\n" % (Consts.minimaxType.keys()[Consts.minimaxType.values().index(self.minimax)].capitalize(),)
+		ret +=  "\tMinimax Type:\t %s\n" % (Consts.minimaxTypeName[self.minimax].capitalize(),)
 		ret +=  "\tReport Adapter:\t %s\n" % (self.reportAdapter,)
 		for slot in self.allSlots:
 			ret += "\t" + slot.__repr__()
@@ -220,7 +243,7 @@ class SimplePSO(object):
         :param psoType: The PSO type, from Consts.psoType
         
 		"""
-		if psoType not in Consts.psoType.values():
+		if psoType not in _PSO_TYPE_VALUES:
 			Util.raiseException("PsoType must be implemented !",TypeError)
 		self.psoType = psoType
 
@@ -229,10 +252,7 @@ class SimplePSO(object):
 		
 		:rtype key: pso Type
 		"""	
-		for key,value in Consts.psoType.items():
-			if value == self.psoType:
-				return key
-		return ""
+		return Consts.psoTypeName.get(self.psoType,"")
 
 	def setTimeSteps(self,num_steps):
 		""" Sets the number of steps to converge
@@ -243,6 +263,7 @@ class SimplePSO(object):
 		if num_steps < 1:
 			Util.raiseException("Number of steps must be >=1", ValueError)
 		self.timeSteps = num_steps
+		self._pct_scale = 100.0 / num_steps
 
 
 	def getMinimax(self):
@@ -251,10 +272,7 @@ class SimplePSO(object):
 		:rtype: The Consts.minimaxType type
 		
 		"""
-		for key,value in Consts.minimaxType.items():
-			if value == self.minimax:
-				return key
-			return ""
+		return Consts.minimaxTypeName.get(self.minimax,"")
 			
 
 	
@@ -271,7 +289,7 @@ class SimplePSO(object):
 		:param minimax: the minimax mode, from Consts.minimaxType
 		
 		"""
-		if minimax not in Consts.minimaxType.values():
+		if minimax not in _MINMAX_VALUES:
 			Util.raiseException("Optimization type must be Maximize or Minimize !", TypeError)
 		
 		self.minimax = minimax	
@@ -318,23 +336,97 @@ class SimplePSO(object):
 		return self.topology.getStatistics()
 
 	def dumpStatsReport(self):
-		""" Dumps the current statistics to the  report adapter """
-		self.topology.statistics()
-		self.reportAdapter.insert(self.getStatistics(),self.topology,self.currentStep)
+		""" Dumps the current statistics to the  report adapter
+		
+		When the report writer thread is running, the statistics and the
+		particles are copied and queued, and the thread inserts them into the
+		report adapter. Otherwise they are inserted right away.
+		
+		"""
+		if self._io_thread is None:
+			self.reportAdapter.insert(self.getStatistics(),self.topology,self.currentStep)
+			return
+		self.raiseReportError()
+		stats = copy.deepcopy(self.getStatistics())
+		particles = [copy.copy(particle) for particle in self.topology]
+		self._io_queue.put((stats,particles,self.currentStep))
+	
+	def raiseReportError(self):
+		""" Raises again (in the caller thread) the exception raised by the
+		report writer thread, if any """
+		error = self._io_error
+		if error is not None:
+			self._io_error = None
+			raise error[0], error[1], error[2]
+	
+	def startReportWriter(self):
+		""" Starts the report writer thread, which opens the report adapter
+		
+		It waits the report adapter to be opened, the exception raised by the
+		open (if any) is raised again.
+		
+		"""
+		self._io_error = None
+		self._io_opened = threading.Event()
+		self._io_queue = Queue.Queue()
+		self._io_thread = threading.Thread(target=self._drain_reports)
+		self._io_thread.setDaemon(True)
+		self._io_thread.start()
+		self._io_opened.wait()
+		if self._io_error is not None:
+			self._io_thread.join()
+			self._io_thread = None
+			self._io_queue = None
+			self.raiseReportError()
+	
+	def stopReportWriter(self):
+		""" Waits the report writer thread to write the queued statistics and
+		save and close the report adapter, the exception raised by the
+		thread (if any) is raised again """
+		self._io_queue.put(None)
+		self._io_thread.join()
+		self._io_thread = None
+		self._io_queue = None
+		self.raiseReportError()
+	
+	def _drain_reports(self):
+		""" Body of the report writer thread
+		
+		All the report adapter calls are done by this thread, the sqlite3
+		connections can only be used by the thread which created them.
+		Any exception is stored to be raised again by the PSO Engine thread.
+		
+		"""
+		try:
+			self.reportAdapter.open()
+		except:
+			self._io_error = exc_info()
+			self._io_opened.set()
+			return
+		self._io_opened.set()
+		try:
+			try:
+				while True:
+					item = self._io_queue.get()
+					if item is None: break
+					stats, particles, step = item
+					self.reportAdapter.insert(stats,particles,step)
+			finally:
+				self.reportAdapter.saveAndClose()
+		except:
+			self._io_error = exc_info()
 		
 		
 	def printStats(self):
 		""" Print swarm statistics"""
-		percent = self.currentStep * 100 / float(self.timeSteps)
-		message = "Step: %d (%.2f%%):" % (self.currentStep, percent)
-		print message
+		print "Step: %d (%.2f%%):" % (self.currentStep, self.currentStep * self._pct_scale)
 		self.topology.statistics()
 		self.topology.printStats()
 
 	
 	def printTimeElapsed(self):
 		""" Shows the time elapsed since the beginning of the solution construction """
-		print "Total time elapsed: %.3f seconds." % (time()-self.time_init)
+		print "Total time elapsed: %.3f seconds." % (perf_counter()-self.time_init)
     	
 	
 	def initialize(self):
@@ -352,7 +444,7 @@ class SimplePSO(object):
 		for it in self.topology.information_updater.applyFunctions(self):
 			pass
 		
-		if self.psoType == Consts.psoType["INERTIA"]:
+		if self.psoType == _INERTIA_PSO:
 			self.updateInertiaFactor()
 		
 		self.currentStep += 1
@@ -374,18 +466,50 @@ class SimplePSO(object):
 
 		"""
 		#Start time
-		self.time_init = time()
+		self.time_init = perf_counter()
 		
 		#Creates a new report if reportAdapter is not None.
-		if  self.reportAdapter: self.reportAdapter.open()
+		if  self.reportAdapter: self.startReportWriter()
 		
-		#Initialize the PSO Engine
-		self.initialize()  #Already evaluates all particles
-
-
-		print "Starting loop over evolutionary algorithm."
+		#Last time step written to the report
+		lastDumpStep = None
+		#The final state is reported only when the swarm was initialized and
+		#the loop did not raise an exception (a break is not an exception)
+		initialized = False
+		loopDone = False
 		
 		try:
+			#Initialize the PSO Engine
+			self.initialize()  #Already evaluates all particles
+			initialized = True
+
+
+			print "Starting loop over evolutionary algorithm."
+		
+			#Time steps where the statistics are printed
+			statsSteps = set()
+			if freq_stats != 0:
+				statsSteps = set(xrange(0,self.timeSteps,freq_stats))
+				statsSteps.add(1)
+		
+			#Keyboard polling functions of the interactive mode
+			kbhit = getch = None
+			if self.interactiveMode:
+				if sys_platform[:3] == "win":
+					kbhit, getch = msvcrt.kbhit, msvcrt.getch
+					quitKeys = "CTRL-Z"
+				elif sys_platform[:5] == "linux":
+					kbhit, getch = Util.kbhit, Util.getch
+					quitKeys = "CTRL-D"
+		
+			#Report dump frequency, a power of two frequency is tested with a bitmask
+			repFreq = 0
+			repMask = None
+			if self.reportAdapter:
+				repFreq = self.reportAdapter.statsGenFreq
+				if (repFreq & (repFreq - 1)) == 0:
+					repMask = repFreq - 1
+			
 			while not self.constructSolution():
 				stopFlagCallback = False
 				stopFlagTerminationCriteria = False
@@ -398,13 +522,17 @@ class SimplePSO(object):
 					for it in self.terminationCriteria.applyFunctions(self):
 						stopFlagTerminationCriteria = it
 				
-				if freq_stats != 0:
-					if (self.currentStep % freq_stats == 0) or (self.currentStep == 1):
-						self.printStats()
+				if self.currentStep in statsSteps:
+					self.printStats()
 					
-				if self.reportAdapter:
-					if self.currentStep % self.reportAdapter.statsGenFreq == 0:
+				if repFreq:
+					if repMask is not None:
+						dumpStats = (self.currentStep & repMask) == 0
+					else:
+						dumpStats = (self.currentStep % repFreq) == 0
+					if dumpStats:
 						self.dumpStatsReport()
+						lastDumpStep = self.currentStep
 				
 				if stopFlagTerminationCriteria:
 					print '\n\tExecution stopped by Termination Criteria function !\n'
@@ -415,49 +543,37 @@ class SimplePSO(object):
 					break
 
 			  
-				if self.interactiveMode:
-					if sys_platform[:3] == "win":
-						if msvcrt.kbhit():
-							if ord(msvcrt.getch()) == Consts.CDefESCKey:
-								print "Loading modules for Interactive mode...",
-								import pypso.Interaction
-								print "done!\n"
-								interact_banner = "## PyPSO v.%s - Interactive Mode ##\nPress CTRL-Z to quit interactive mode." % (pypso.__version__,)
-								session_locals = {  "pso_engine"  : self,
-													"topology" : self.getTopology(),
-													"swarm_statistics": self.getTopology().swarmStats,
-													"topology_statistics": self.getTopology().topologyStats,
-													"pypso"   : pypso ,
-													"it"         : pypso.Interaction}
-								print
-								code.interact(interact_banner, local=session_locals)
-					elif sys_platform[:5] == "linux":
-						if Util.kbhit():
-							if ord(Util.getch()) == Consts.CDefESCKey:
-								print "Loading modules for Interactive mode...",
-								import pypso.Interaction
-								print "done!\n"
-								interact_banner = "## PyPSO v.%s - Interactive Mode ##\nPress CTRL-D to quit interactive mode." % (pypso.__version__,)
-								session_locals = {  "pso_engine"  : self,
-													"topology" : self.getTopology(),
-													"swarm_statistics": self.getTopology().swarmStats,
-													"topology_statistics": self.getTopology().topologyStats,
-													"pypso"   : pypso ,
-													"it"         : pypso.Interaction}
-								print
-								code.interact(interact_banner, local=session_locals)
+				if kbhit is not None and kbhit():
+					if ord(getch()) == Consts.CDefESCKey:
+						print "Loading modules for Interactive mode...",
+						import pypso.Interaction
+						print "done!\n"
+						interact_banner = "## PyPSO v.%s - Interactive Mode ##\nPress %s to quit interactive mode." % (pypso.__version__,quitKeys)
+						session_locals = {  "pso_engine"  : self,
+											"topology" : self.getTopology(),
+											"swarm_statistics": self.getTopology().swarmStats,
+											"topology_statistics": self.getTopology().topologyStats,
+											"pypso"   : pypso ,
+											"it"         : pypso.Interaction}
+						print
+						code.interact(interact_banner, local=session_locals)
+			loopDone = True
                                     
 		except KeyboardInterrupt:
 			print "\n\tA break was detected, you have interrupted the evolution !\n"
+			loopDone = initialized
+		finally:
+			#The report is always closed, the final state is reported unless the loop failed
+			if self.reportAdapter:
+				try:
+					if loopDone and self.currentStep != lastDumpStep:
+						self.dumpStatsReport()
+				finally:
+					self.stopReportWriter()
 
 		if freq_stats != 0:
 			self.printStats()
 			self.printTimeElapsed()
-    
-		if self.reportAdapter:
-			if (self.currentStep % self.reportAdapter.statsGenFreq == 0):
-				self.dumpStatsReport()
-			self.reportAdapter.saveAndClose()	
 		
 		
 		
\ No newline at end of file
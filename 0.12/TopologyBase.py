@@ -185,8 +185,8 @@ class TopologyBase(object):
 		""" Returns the string representation of the topology """
 		ret =  "- Topology\n"
 		ret += "\nSwarm Size:\t %d\n" % (self.swarmSize,)
-		ret += "Sort Type:\t\t %s\n" % (Consts.sortType.keys()[Consts.sortType.values().index(self.sortType)].capitalize(),)
-		ret += "\tMinimax Type:\t\t %s\n" % (Consts.minimaxType.keys()[Consts.minimaxType.values().index(self.minimax)].capitalize(),)
+		ret += "Sort Type:\t\t %s\n" % (Consts.sortTypeName[self.sortType].capitalize(),)
+		ret += "\tMinimax Type:\t\t %s\n" % (Consts.minimaxTypeName[self.minimax].capitalize(),)
 		for slot in self.allSlots:
 			ret+= "\t" + slot.__repr__()
 		ret += "\n"